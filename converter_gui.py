@@ -1,12 +1,21 @@
+import codecs
 import csv
+import io
+import itertools
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
 
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import filedialog, messagebox, ttk
-from PIL import Image, ImageTk
 
 
 LEVEL_NUMERIC_MAP: Dict[str, str] = {
@@ -31,12 +40,37 @@ LEVEL_TEXT_MAP: Dict[str, str] = {
     "extreme": "very_hard",
 }
 
+# Exact-match table covering bare digits, already-normalized names and blanks.
+_DIFFICULTY_LOOKUP: Dict[str, str] = {**LEVEL_NUMERIC_MAP, **LEVEL_TEXT_MAP, "": "easy"}
+
 QUESTION_TYPE_MAP: Dict[str, str] = {
     "R": "multiple_choice",
     "C": "multiple_choice",
     "L": "short_answer",
 }
 
+# Raw question-type codes seen so far, prewarmed with the common spellings.
+_QUESTION_TYPE_CACHE: Dict[str | None, str] = {
+    code: QUESTION_TYPE_MAP.get((code or "").upper(), "multiple_choice")
+    for code in ("R", "C", "L", "r", "c", "l", "", None)
+}
+
+# Accepted input headers for each field the converter reads, in priority order.
+FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "tnpe": ("TNpe", "Type"),
+    "question_text": ("Description", "Question"),
+    "marks": ("Marks",),
+    "level": ("LEVEL", "Difficulty", "EASY"),
+    "question_type": ("QuestionTNpe", "QuestionType", "QuestionTNpe(R=Radio,C=Checkbox,L=Onelinner)"),
+    "answer_text": ("Description", "Answer"),
+    "is_right": ("IsRightAnswer",),
+}
+
+# IsRightAnswer values that mark an answer as correct.
+_RIGHT_ANSWER_FLAGS = frozenset({"Y", "y"})
+
+OPTION_LETTERS: Sequence[str] = ("a", "b", "c", "d")
+
 OUTPUT_FIELDS: Sequence[str] = (
     "question_text",
     "question_type",
@@ -124,30 +158,81 @@ DEFAULT_FONT_FAMILY = "Segoe UI"
 FONT_CHOICES: Sequence[str] = ("Segoe UI", "Calibri", "Verdana", "Helvetica")
 FONT_SIZE_OFFSET_RANGE = (-2, 4)
 
+ENCODING_SNIFF_BYTES = 64 * 1024
+OUTPUT_WRITE_BATCH_SIZE = 1000
 
-@dataclass
+# How often the Tk main loop checks for results from background workers.
+WORKER_POLL_INTERVAL_MS = 50
+
+# Tcl helper that inserts a whole list of value rows into a Treeview in one
+# interpreter call, numbering item ids from ``start``.
+TREE_BULK_INSERT_PROC = """
+proc ::qtc_tree_bulk_insert {tree start rows} {
+    set index $start
+    foreach values $rows {
+        $tree insert {} end -id $index -values $values
+        incr index
+    }
+}
+"""
+
+
+@dataclass(slots=True)
 class QuestionRecord:
-    metadata_row: Dict[str, str]
-    answers: List[Dict[str, str]]
+    question_text: str
+    marks: str
+    level_raw: str
+    question_type_code: str
+    # (description, is_right) pairs in file order.
+    answers: List[Tuple[str, bool]]
+
+
+# Deletes every non-alphanumeric ASCII character in a single C-level pass.
+_NON_ALNUM_ASCII = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isalnum()))
 
 
+@lru_cache(maxsize=None)
 def _normalize_key(key: str) -> str:
+    if key.isascii():
+        return key.lower().translate(_NON_ALNUM_ASCII)
     return "".join(ch.lower() for ch in key if ch.isalnum())
 
 
-def _get_field(row: Dict[str, str], *aliases: str) -> str:
-    for alias in aliases:
-        alias_key = _normalize_key(alias)
-        for existing_key, value in row.items():
-            if _normalize_key(existing_key) == alias_key:
-                return (value or "").strip()
-    return ""
+_NORMALIZED_FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    field: tuple(_normalize_key(alias) for alias in aliases) for field, aliases in FIELD_ALIASES.items()
+}
+
+
+def _build_field_index(headers: Sequence[str]) -> Dict[str, int]:
+    # Resolve every FIELD_ALIASES entry to a column once per file, so each
+    # row lookup is a single dict access instead of an alias scan.
+    header_index: Dict[str, int] = {}
+    for index, name in enumerate(headers):
+        header_index.setdefault(_normalize_key(name), index)
+
+    field_index: Dict[str, int] = {}
+    for field, alias_keys in _NORMALIZED_FIELD_ALIASES.items():
+        for alias_key in alias_keys:
+            index = header_index.get(alias_key)
+            if index is not None:
+                field_index[field] = index
+                break
+    return field_index
 
 
+def _get_field(row: Sequence[str], field_index: Dict[str, int], field: str) -> str:
+    index = field_index.get(field)
+    if index is None or index >= len(row):
+        return ""
+    return row[index].strip()
+
+
+@lru_cache(maxsize=None)
 def _determine_difficulty(level_raw: str) -> str:
     level_raw = (level_raw or "").strip()
-    if not level_raw:
-        return "easy"
+    difficulty = _DIFFICULTY_LOOKUP.get(level_raw)
+    if difficulty is not None:
+        return difficulty
 
     digits = "".join(ch for ch in level_raw if ch.isdigit())
     if digits:
@@ -158,133 +243,262 @@ def _determine_difficulty(level_raw: str) -> str:
 
 
 def _determine_question_type(code: str) -> str:
-    return QUESTION_TYPE_MAP.get((code or "").strip().upper(), "multiple_choice")
-
+    question_type = _QUESTION_TYPE_CACHE.get(code)
+    if question_type is None:
+        question_type = QUESTION_TYPE_MAP.get((code or "").strip().upper(), "multiple_choice")
+        _QUESTION_TYPE_CACHE[code] = question_type
+    return question_type
 
-def _build_output_record(question: Dict[str, str], answers: List[Dict[str, str]], warnings: List[str]) -> Dict[str, str]:
-    question_text = _get_field(question, "Description", "Question")
-    marks = _get_field(question, "Marks") or "1"
-    level_raw = _get_field(question, "LEVEL", "Difficulty", "EASY")
-    difficulty = _determine_difficulty(level_raw)
 
-    question_type_code = _get_field(
-        question,
-        "QuestionTNpe",
-        "QuestionType",
-        "QuestionTNpe(R=Radio,C=Checkbox,L=Onelinner)",
-    )
-    question_type = _determine_question_type(question_type_code)
-
-    option_fields = ["", "", "", ""]
-    correct_letters: List[str] = []
-    letter_sequence = ["a", "b", "c", "d"]
+def _resolve_options(
+    question: QuestionRecord, question_type: str, warnings: List[str]
+) -> Tuple[List[str], str]:
+    answers = question.answers
 
     if len(answers) > 4:
         warnings.append(
-            f"Question '{question_text[:30]}...' has more than 4 answer options; only the first four were retained."
+            f"Question '{question.question_text[:30]}...' has more than 4 answer options; only the first four were retained."
         )
 
-    for idx, answer in enumerate(answers[:4]):
-        option_fields[idx] = _get_field(answer, "Description", "Answer")
-        is_correct = _get_field(answer, "IsRightAnswer").strip().upper() == "Y"
-        if is_correct:
-            correct_letters.append(letter_sequence[idx])
-
-    correct_answer = ",".join(correct_letters)
+    retained = answers[:4]
+    option_fields = [description for description, _ in retained]
+    option_fields += [""] * (4 - len(option_fields))
+    correct_answer = ",".join(
+        letter for letter, (_, is_correct) in zip(OPTION_LETTERS, retained) if is_correct
+    )
 
     if question_type == "short_answer" and not correct_answer and answers:
         # Assume the first provided answer is the expected one.
         correct_answer = option_fields[0]
 
-    return {
-        "question_text": question_text,
-        "question_type": question_type,
-        "option_a": option_fields[0],
-        "option_b": option_fields[1],
-        "option_c": option_fields[2],
-        "option_d": option_fields[3],
-        "correct_answer": correct_answer,
-        "marks": marks,
-        "difficulty_level": difficulty,
-        "explanation": "",
-    }
+    return option_fields, correct_answer
+
+
+def _build_output_record(question: QuestionRecord, warnings: List[str]) -> Tuple[str, ...]:
+    question_type = _determine_question_type(question.question_type_code)
+    option_fields, correct_answer = _resolve_options(question, question_type, warnings)
+
+    # Values are ordered to match OUTPUT_FIELDS.
+    return (
+        question.question_text,
+        question_type,
+        option_fields[0],
+        option_fields[1],
+        option_fields[2],
+        option_fields[3],
+        correct_answer,
+        question.marks or "1",
+        _determine_difficulty(question.level_raw),
+        "",
+    )
 
 
-def _read_question_records(input_path: Path) -> Tuple[List[QuestionRecord], List[str]]:
-    warnings: List[str] = []
-    questions: List[QuestionRecord] = []
-    current_question: Dict[str, str] | None = None
-    current_answers: List[Dict[str, str]] = []
-
-    # Try multiple encodings to handle different file formats
-    encodings = ['utf-8-sig', 'utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-    
-    for encoding in encodings:
-        try:
-            with input_path.open("r", encoding=encoding, newline="") as csv_file:
-                reader = csv.DictReader(csv_file)
-                for row in reader:
-                    tnpe = _get_field(row, "TNpe", "Type").upper()
-                    if not tnpe:
-                        continue
-                    if tnpe == "Q":
-                        if current_question is not None:
-                            questions.append(QuestionRecord(current_question, current_answers))
-                        current_question = row
-                        current_answers = []
-                    elif tnpe == "A":
-                        if current_question is None:
-                            warnings.append("Encountered answer row before any question row; skipping answer.")
-                            continue
-                        current_answers.append(row)
-                    else:
-                        warnings.append(f"Unrecognized TNpe value '{tnpe}' encountered; row skipped.")
-            break  # Successfully read with this encoding
-        except UnicodeDecodeError:
-            continue
-    else:
-        # If all encodings fail, raise an error
-        raise UnicodeDecodeError("Failed to read CSV file with any supported encoding")
+def _build_preview_record(question: QuestionRecord, warnings: List[str]) -> Tuple[str, str, str, str, str]:
+    question_type = _determine_question_type(question.question_type_code)
+    _, correct_answer = _resolve_options(question, question_type, warnings)
+
+    # Values are display-ready and ordered to match the preview tree columns,
+    # so the tree can insert them without any per-row formatting.
+    return (
+        question.question_text,
+        question_type,
+        correct_answer.replace(",", ", ") or "—",
+        question.marks or "1",
+        _determine_difficulty(question.level_raw),
+    )
+
+
+def _detect_encoding(head: bytes) -> str:
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    if head.isascii():
+        return "utf-8"
+
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        # A multi-byte character cut in half by the sniff window is still UTF-8.
+        truncated = len(head) == ENCODING_SNIFF_BYTES and exc.start >= len(head) - 3
+        if not truncated:
+            return "cp1252"
+    return "utf-8"
+
+
+# Per-thread counts of input bytes that needed special decoding; preview and
+# conversion parse on separate worker threads.
+_decode_stats = threading.local()
+
+
+def _replace_and_count(exc: UnicodeError) -> Tuple[str, int]:
+    if not isinstance(exc, UnicodeDecodeError):
+        raise exc
+    _decode_stats.replaced_bytes = getattr(_decode_stats, "replaced_bytes", 0) + exc.end - exc.start
+    return "\ufffd", exc.end
+
+
+def _cp1252_fallback(exc: UnicodeError) -> Tuple[str, int]:
+    # A file whose sniffed head is ASCII may still hold cp1252 text further on, so
+    # invalid UTF-8 bytes are decoded as cp1252 rather than lost.
+    if not isinstance(exc, UnicodeDecodeError):
+        raise exc
+    text = exc.object[exc.start:exc.end].decode("cp1252", "replace")
+    replaced = text.count("\ufffd")
+    _decode_stats.replaced_bytes = getattr(_decode_stats, "replaced_bytes", 0) + replaced
+    _decode_stats.fallback_bytes = getattr(_decode_stats, "fallback_bytes", 0) + len(text) - replaced
+    return text, exc.end
+
+
+codecs.register_error("qtc-replace-and-count", _replace_and_count)
+codecs.register_error("qtc-cp1252-fallback", _cp1252_fallback)
+
+
+def _open_csv_text(input_path: Path) -> TextIO:
+    # Sniff and decode through the same binary handle so the file is opened only once.
+    raw_file = input_path.open("rb")
+    try:
+        encoding = _detect_encoding(raw_file.read(ENCODING_SNIFF_BYTES))
+        raw_file.seek(0)
+        # Decoding never fails, so the file is always parsed in a single pass: non-UTF-8
+        # bytes past the sniff window fall back to cp1252, and anything still
+        # undecodable becomes U+FFFD. Both are counted so the caller can report them.
+        errors = "qtc-cp1252-fallback" if encoding == "utf-8" else "qtc-replace-and-count"
+        return io.TextIOWrapper(raw_file, encoding=encoding, errors=errors, newline="")
+    except BaseException:
+        raw_file.close()
+        raise
+
+
+def _iter_question_records(input_path: Path, warnings: List[str]) -> Iterator[QuestionRecord]:
+    # Each question is yielded once its answer rows are complete, so callers can
+    # stream the file; parse warnings are appended to ``warnings`` along the way.
+    current_question: QuestionRecord | None = None
+    _decode_stats.replaced_bytes = 0
+    _decode_stats.fallback_bytes = 0
+
+    with _open_csv_text(input_path) as csv_file:
+        reader = csv.reader(csv_file)
+        field_index = _build_field_index(next(reader, []))
+        for row in reader:
+            tnpe = _get_field(row, field_index, "tnpe").upper()
+            if not tnpe:
+                continue
+            if tnpe == "Q":
+                if current_question is not None:
+                    yield current_question
+                current_question = QuestionRecord(
+                    question_text=_get_field(row, field_index, "question_text"),
+                    # Low-cardinality columns are interned so repeated values share one object.
+                    marks=sys.intern(_get_field(row, field_index, "marks")),
+                    level_raw=sys.intern(_get_field(row, field_index, "level")),
+                    question_type_code=sys.intern(_get_field(row, field_index, "question_type")),
+                    answers=[],
+                )
+            elif tnpe == "A":
+                if current_question is None:
+                    warnings.append("Encountered answer row before any question row; skipping answer.")
+                    continue
+                current_question.answers.append(
+                    (
+                        _get_field(row, field_index, "answer_text"),
+                        _get_field(row, field_index, "is_right") in _RIGHT_ANSWER_FLAGS,
+                    )
+                )
+            else:
+                warnings.append(f"Unrecognized TNpe value '{tnpe}' encountered; row skipped.")
+
+    if _decode_stats.fallback_bytes:
+        warnings.append(
+            f"{_decode_stats.fallback_bytes} non-UTF-8 byte(s) in '{input_path.name}' were decoded as cp1252."
+        )
+    if _decode_stats.replaced_bytes:
+        warnings.append(
+            f"{_decode_stats.replaced_bytes} undecodable byte(s) in '{input_path.name}' were replaced with '\ufffd'."
+        )
 
     if current_question is not None:
-        questions.append(QuestionRecord(current_question, current_answers))
+        yield current_question
 
-    return questions, warnings
 
+def _read_question_records(input_path: Path) -> Tuple[List[QuestionRecord], List[str]]:
+    warnings: List[str] = []
+    questions = list(_iter_question_records(input_path, warnings))
+    return questions, warnings
 
-def convert_question_bank(input_path: Path) -> Tuple[List[Dict[str, str]], List[str]]:
-    questions, warnings = _read_question_records(input_path)
 
-    output_rows: List[Dict[str, str]] = []
+def iter_converted_rows(questions: Iterable[QuestionRecord], warnings: List[str]) -> Iterator[Tuple[str, ...]]:
+    # Rows are produced lazily so they can be streamed straight to disk;
+    # conversion warnings are appended to ``warnings`` as the iterator advances.
     for question_record in questions:
-        output_rows.append(
-            _build_output_record(question_record.metadata_row, question_record.answers, warnings)
-        )
+        yield _build_output_record(question_record, warnings)
+
 
-    return output_rows, warnings
+def convert_question_bank(input_path: Path) -> Tuple[List[Tuple[str, ...]], List[str]]:
+    questions, warnings = _read_question_records(input_path)
+    return list(iter_converted_rows(questions, warnings)), warnings
 
 
 def load_conversion_preview(
     input_path: Path,
-) -> Tuple[List[Tuple[QuestionRecord, Dict[str, str]]], List[str]]:
+) -> Tuple[List[Tuple[QuestionRecord, Tuple[str, ...]]], List[str]]:
     questions, warnings = _read_question_records(input_path)
-    preview: List[Tuple[QuestionRecord, Dict[str, str]]] = []
+    preview: List[Tuple[QuestionRecord, Tuple[str, ...]]] = []
 
     for question_record in questions:
-        converted = _build_output_record(
-            question_record.metadata_row, question_record.answers, warnings
-        )
-        preview.append((question_record, converted))
+        preview.append((question_record, _build_preview_record(question_record, warnings)))
 
     return preview, warnings
 
 
-def write_output_csv(output_path: Path, rows: Iterable[Dict[str, str]]) -> None:
-    with output_path.open("w", encoding="utf-8", newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=OUTPUT_FIELDS)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+def write_output_csv(output_path: Path, rows: Iterable[Sequence[str]]) -> None:
+    # ``rows`` is consumed while the input is still being parsed, so stream into a
+    # temporary file beside the target and only replace an existing output once
+    # every row has been written; a parse error leaves the old file untouched.
+    temp_file = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", newline="", suffix=".tmp", dir=output_path.parent, delete=False
+    )
+    try:
+        with temp_file as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(OUTPUT_FIELDS)
+
+            # Rows without delimiters, quotes or line breaks need no quoting, so they
+            # are joined directly and written in batches; the rest go through csv.
+            terminator = writer.dialect.lineterminator
+            batch: List[str] = []
+            for row in rows:
+                line = ",".join(row)
+                needs_quoting = (
+                    line.count(",") != len(row) - 1 or '"' in line or "\n" in line or "\r" in line
+                )
+                if needs_quoting:
+                    if batch:
+                        csv_file.write(terminator.join(batch) + terminator)
+                        batch.clear()
+                    writer.writerow(row)
+                    continue
+
+                batch.append(line)
+                if len(batch) >= OUTPUT_WRITE_BATCH_SIZE:
+                    csv_file.write(terminator.join(batch) + terminator)
+                    batch.clear()
+
+            if batch:
+                csv_file.write(terminator.join(batch) + terminator)
+
+        # NamedTemporaryFile is created 0600; give the result the permissions the
+        # existing output had, or those a plain open() would have given a new file.
+        if output_path.exists():
+            shutil.copymode(output_path, temp_file.name)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_file.name, 0o666 & ~umask)
+        os.replace(temp_file.name, output_path)
+    except BaseException:
+        Path(temp_file.name).unlink(missing_ok=True)
+        raise
 
 
 class ConverterGUI:
@@ -294,7 +508,19 @@ class ConverterGUI:
         self.root.geometry("960x720")
 
         self.input_path: Path | None = None
-        self.preview_pairs: List[Tuple[QuestionRecord, Dict[str, str]]] = []
+        self.preview_pairs: List[Tuple[QuestionRecord, Tuple[str, ...]]] = []
+        # Values currently shown in the preview tree, indexed by item id.
+        self._rendered_values: List[Tuple[str, ...]] = []
+        self._detail_cache: Dict[int, str] = {}
+        self._last_detail: str | None = None
+        self._details_scheduled = False
+        self._log_buffer: List[str] = []
+        self._log_flush_pending = False
+        self._font_style_cache: Dict[str, Tuple[str, str]] = {}
+        self._conversion_queue: "queue.Queue[Tuple[str, object, List[str]]]" = queue.Queue()
+        self._conversion_in_flight = False
+        self._preview_queue: "queue.Queue[Tuple[str, Path, bool, object, List[str]]]" = queue.Queue()
+        self._preview_in_flight = False
 
         self.current_theme: Theme = THEMES[DEFAULT_THEME_NAME]
         self.font_family = DEFAULT_FONT_FAMILY
@@ -303,11 +529,26 @@ class ConverterGUI:
         self.base_font = tkfont.nametofont("TkDefaultFont")
         self.base_font.configure(family=self.font_family, size=self.base_font.cget("size"))
         self.base_font_size = self.base_font.cget("size")
+        # Size of a freshly created font, which _update_fonts offsets; read once, not per update.
+        self.new_font_size = tkfont.Font(root=self.root).cget("size")
         self.mono_base_size = tkfont.Font(font=("Consolas", 10)).cget("size")
 
+        self.root.tk.eval(TREE_BULK_INSERT_PROC)
+
         self._configure_styles()
         self._build_widgets()
         self._build_menu()
+
+        self._font_labels: List[tk.Label] = []
+        self._font_buttons: List[tk.Button] = []
+        self._font_texts: List[tk.Text] = []
+        self._font_widget_lists: Dict[type, List] = {
+            tk.Label: self._font_labels,
+            tk.Button: self._font_buttons,
+            tk.Text: self._font_texts,
+        }
+        self._collect_font_widgets(self.root)
+
         self._apply_theme()
         self._update_fonts()
 
@@ -402,16 +643,16 @@ class ConverterGUI:
             self.preview_tree.heading(key, text=title)
             self.preview_tree.column(key, width=160 if key == "question" else 120, anchor=tk.W)
 
-        tree_scroll = ttk.Scrollbar(
+        self.tree_scroll = ttk.Scrollbar(
             self.tree_container,
             orient=tk.VERTICAL,
             command=self.preview_tree.yview,
             style="Vertical.TScrollbar",
         )
-        self.preview_tree.configure(yscrollcommand=tree_scroll.set)
+        self.preview_tree.configure(yscrollcommand=self.tree_scroll.set)
 
         self.preview_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        tree_scroll.pack(side=tk.LEFT, fill=tk.Y, padx=(6, 0))
+        self.tree_scroll.pack(side=tk.LEFT, fill=tk.Y, padx=(6, 0))
 
         self.detail_frame = tk.LabelFrame(self.preview_tab, text="Conversion Details", padx=16, pady=12)
         self.detail_frame.pack(fill=tk.BOTH, expand=True, pady=(16, 0))
@@ -427,7 +668,7 @@ class ConverterGUI:
         self.detail_text.pack(fill=tk.BOTH, expand=True)
         self.detail_text.configure(state=tk.DISABLED)
 
-        self.preview_tree.bind("<<TreeviewSelect>>", lambda _: self._show_preview_details())
+        self.preview_tree.bind("<<TreeviewSelect>>", self._schedule_preview_details)
 
         self.guide_label = tk.Label(
             self.guide_tab,
@@ -658,6 +899,9 @@ class ConverterGUI:
         try:
             logo_path = Path(__file__).parent / "logo.jpg"
             if logo_path.exists():
+                # Pillow is only needed here, so it is imported on first use.
+                from PIL import Image, ImageTk
+
                 pil_image = Image.open(logo_path)
                 # Resize image to fit nicely in the dialog
                 pil_image = pil_image.resize((150, 150), Image.Resampling.LANCZOS)
@@ -796,8 +1040,9 @@ class ConverterGUI:
             ),
         ]
 
-        for item in self.guide_tree.get_children():
-            self.guide_tree.delete(item)
+        children = self.guide_tree.get_children()
+        if children:
+            self.guide_tree.delete(*children)
 
         for row in guide_rows:
             self.guide_tree.insert("", tk.END, values=row)
@@ -814,63 +1059,136 @@ class ConverterGUI:
             self._load_preview()
 
     def _convert_and_save(self) -> None:
+        if self._conversion_in_flight:
+            return
+
         if self.input_path is None:
             messagebox.showwarning("No input file", "Please select an input CSV file first.")
             return
 
+        default_name = f"{self.input_path.stem}_converted.csv"
+        output_file = filedialog.asksaveasfilename(
+            title="Save Converted CSV",
+            defaultextension=".csv",
+            initialfile=default_name,
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+        )
+        if not output_file:
+            return
+
+        self._conversion_in_flight = True
+        self.convert_button.state(["disabled"])
+        self._log(f"Converting '{self.input_path.name}'...")
+
+        # Parsing and writing run on a worker thread so the window stays responsive;
+        # results come back through the queue polled by _poll_conversion.
+        threading.Thread(
+            target=self._run_conversion,
+            args=(self.input_path, Path(output_file)),
+            daemon=True,
+        ).start()
+        self.root.after(WORKER_POLL_INTERVAL_MS, self._poll_conversion)
+
+    def _run_conversion(self, input_path: Path, output_path: Path) -> None:
+        # Runs off the main thread: Tcl is not thread-safe, so only the queue is touched here.
         try:
-            rows, warnings = convert_question_bank(self.input_path)
-            if not rows:
-                messagebox.showwarning(
-                    "No questions found",
-                    "The selected file did not contain any questions to convert.",
-                )
+            warnings: List[str] = []
+            questions = _iter_question_records(input_path, warnings)
+            # Peek at the first question so an empty file never creates an output file.
+            first_question = next(questions, None)
+            if first_question is None:
+                self._conversion_queue.put(("empty", output_path, warnings))
                 return
+            questions = itertools.chain((first_question,), questions)
+            write_output_csv(output_path, iter_converted_rows(questions, warnings))
+        except Exception as exc:  # pylint: disable=broad-except
+            self._conversion_queue.put(("error", exc, []))
+            return
+        self._conversion_queue.put(("done", output_path, warnings))
 
-            default_name = f"{self.input_path.stem}_converted.csv"
-            output_file = filedialog.asksaveasfilename(
-                title="Save Converted CSV",
-                defaultextension=".csv",
-                initialfile=default_name,
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            )
-            if not output_file:
-                return
+    def _poll_conversion(self) -> None:
+        try:
+            status, payload, warnings = self._conversion_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(WORKER_POLL_INTERVAL_MS, self._poll_conversion)
+            return
 
-            output_path = Path(output_file)
-            write_output_csv(output_path, rows)
+        self._conversion_in_flight = False
+        self.convert_button.state(["!disabled"])
 
-            messagebox.showinfo(
-                "Conversion complete",
-                f"Successfully saved converted CSV to:\n{output_path}",
+        if status == "empty":
+            messagebox.showwarning(
+                "No questions found",
+                "The selected file did not contain any questions to convert.",
             )
+            return
 
-            self._log("Conversion successful.")
-            for warning in warnings:
-                self._log(f"Warning: {warning}")
+        if status == "error":
+            messagebox.showerror("Conversion failed", str(payload))
+            self._log(f"Error: {payload}")
+            return
 
-            self._load_preview(show_alerts=False)
-        except Exception as exc:  # pylint: disable=broad-except
-            messagebox.showerror("Conversion failed", str(exc))
-            self._log(f"Error: {exc}")
+        messagebox.showinfo(
+            "Conversion complete",
+            f"Successfully saved converted CSV to:\n{payload}",
+        )
+
+        self._log("Conversion successful.")
+        for warning in warnings:
+            self._log(f"Warning: {warning}")
+
+        self._load_preview(show_alerts=False)
 
     def _load_preview(self, show_alerts: bool = True) -> None:
         if self.input_path is None:
             return
 
+        # Only one preview is parsed at a time; if the file changes meanwhile,
+        # _poll_preview discards the stale result and loads the new file.
+        if self._preview_in_flight:
+            return
+        self._preview_in_flight = True
+
+        threading.Thread(
+            target=self._run_preview,
+            args=(self.input_path, show_alerts),
+            daemon=True,
+        ).start()
+        self.root.after(WORKER_POLL_INTERVAL_MS, self._poll_preview)
+
+    def _run_preview(self, input_path: Path, show_alerts: bool) -> None:
+        # Runs off the main thread: Tcl is not thread-safe, so only the queue is touched here.
         try:
-            preview_pairs, warnings = load_conversion_preview(self.input_path)
+            preview_pairs, warnings = load_conversion_preview(input_path)
         except Exception as exc:  # pylint: disable=broad-except
+            self._preview_queue.put(("error", input_path, show_alerts, exc, []))
+            return
+        self._preview_queue.put(("ok", input_path, show_alerts, preview_pairs, warnings))
+
+    def _poll_preview(self) -> None:
+        try:
+            status, input_path, show_alerts, payload, warnings = self._preview_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(WORKER_POLL_INTERVAL_MS, self._poll_preview)
+            return
+
+        self._preview_in_flight = False
+        if input_path != self.input_path:
+            self._load_preview(show_alerts)
+            return
+
+        if status == "error":
             if show_alerts:
-                messagebox.showerror("Preview failed", str(exc))
-            self._log(f"Error generating preview: {exc}")
+                messagebox.showerror("Preview failed", str(payload))
+            self._log(f"Error generating preview: {payload}")
             return
 
-        self.preview_pairs = preview_pairs
+        self.preview_pairs = payload
+        self._detail_cache.clear()
         self._refresh_preview_tree()
 
         self._log(
-            f"Loaded {len(self.preview_pairs)} question(s) from '{self.input_path.name}' for preview."
+            f"Loaded {len(self.preview_pairs)} question(s) from '{input_path.name}' for preview."
         )
         for warning in warnings:
             self._log(f"Warning: {warning}")
@@ -885,23 +1203,45 @@ class ConverterGUI:
             self._update_detail_panel("No questions were detected in the selected file.")
 
     def _refresh_preview_tree(self) -> None:
-        for item in self.preview_tree.get_children():
-            self.preview_tree.delete(item)
-
-        for index, (_, converted) in enumerate(self.preview_pairs):
-            correct = converted["correct_answer"].replace(",", ", ") or "—"
-            self.preview_tree.insert(
-                "",
-                tk.END,
-                iid=str(index),
-                values=(
-                    converted["question_text"],
-                    converted["question_type"],
-                    correct,
-                    converted["marks"],
-                    converted["difficulty_level"],
-                ),
-            )
+        # Detach the scrollbar during the bulk load so Tk does not update it after every insert.
+        self.preview_tree.configure(yscrollcommand="")
+
+        # Every row is materialized so the scrollbar reflects the whole preview; only
+        # items whose values actually changed are touched, so re-previewing an
+        # unchanged file issues no Tcl writes for existing rows.
+        rendered = self._rendered_values
+        target = len(self.preview_pairs)
+
+        for index in range(min(len(rendered), target)):
+            values = self.preview_pairs[index][1]
+            if rendered[index] != values:
+                self.preview_tree.item(str(index), values=values)
+                rendered[index] = values
+
+        if len(rendered) > target:
+            self.preview_tree.delete(*(str(index) for index in range(target, len(rendered))))
+            del rendered[target:]
+
+        start = len(rendered)
+        if target > start:
+            rows = tuple(values for _, values in self.preview_pairs[start:target])
+            # Nested tuples reach Tcl as proper lists, so no manual quoting is needed.
+            self.preview_tree.tk.call("::qtc_tree_bulk_insert", str(self.preview_tree), start, rows)
+            rendered.extend(rows)
+
+        self.preview_tree.configure(yscrollcommand=self.tree_scroll.set)
+
+    def _schedule_preview_details(self, _event: tk.Event | None = None) -> None:
+        # Key-repeat navigation fires a selection event per step; render only once the
+        # event queue drains so just the final selection is shown.
+        if self._details_scheduled:
+            return
+        self._details_scheduled = True
+        self.root.after_idle(self._run_scheduled_preview_details)
+
+    def _run_scheduled_preview_details(self) -> None:
+        self._details_scheduled = False
+        self._show_preview_details()
 
     def _show_preview_details(self) -> None:
         selection = self.preview_tree.selection()
@@ -912,22 +1252,24 @@ class ConverterGUI:
         if index >= len(self.preview_pairs):
             return
 
-        question_record, converted = self.preview_pairs[index]
+        # Details are built the first time a row is selected and reused on later selections.
+        detail_text = self._detail_cache.get(index)
+        if detail_text is None:
+            detail_text = self._build_detail_text(self.preview_pairs[index][0])
+            self._detail_cache[index] = detail_text
 
-        question_type_code = _get_field(
-            question_record.metadata_row,
-            "QuestionTNpe",
-            "QuestionType",
-            "QuestionTNpe(R=Radio,C=Checkbox,L=Onelinner)",
-        )
-        question_type_code = question_type_code.upper() or "R"
+        self._update_detail_panel(detail_text)
+
+    def _build_detail_text(self, question_record: QuestionRecord) -> str:
+        # The full record is only needed for the selected question, so build it on demand.
+        converted = dict(zip(OUTPUT_FIELDS, _build_output_record(question_record, [])))
 
-        answers_lines = []
-        for idx, answer in enumerate(question_record.answers, start=1):
-            flag = _get_field(answer, "IsRightAnswer").upper() == "Y"
-            marker = "[Correct]" if flag else "[ ]"
-            description = _get_field(answer, "Description")
-            answers_lines.append(f"  {idx}. {marker} {description}")
+        question_type_code = question_record.question_type_code.upper() or "R"
+
+        answers_lines = [
+            f"  {idx}. {'[Correct]' if is_right else '[ ]'} {description}"
+            for idx, (description, is_right) in enumerate(question_record.answers, start=1)
+        ]
 
         converted_lines = [
             f"Question Text  : {converted['question_text']}",
@@ -942,58 +1284,100 @@ class ConverterGUI:
             f"  D. {converted['option_d']}",
         ]
 
-        detail_text = "Input Question Row:\n" + _get_field(
-            question_record.metadata_row,
-            "Description",
-            "Question",
-        )
-        detail_text += "\n\nAnswer Options:\n" + ("\n".join(answers_lines) or "  (none)")
-        detail_text += "\n\nConverted Output:\n" + "\n".join(converted_lines)
-
-        self._update_detail_panel(detail_text)
+        parts = [
+            "Input Question Row:",
+            question_record.question_text,
+            "",
+            "Answer Options:",
+            *(answers_lines or ["  (none)"]),
+            "",
+            "Converted Output:",
+            *converted_lines,
+        ]
+        return "\n".join(parts)
 
     def _update_detail_panel(self, message: str) -> None:
+        # Re-selecting the same row yields the same (cached) string; leave the widget alone.
+        if message == self._last_detail:
+            return
+        self._last_detail = message
+
         self.detail_text.configure(state=tk.NORMAL)
         self.detail_text.delete("1.0", tk.END)
         self.detail_text.insert(tk.END, message)
         self.detail_text.configure(state=tk.DISABLED)
 
     def _apply_settings_changes(self, dialog: tk.Toplevel, theme_name: str, font_family: str, size_offset: int) -> None:
-        self.current_theme = THEMES.get(theme_name, self.current_theme)
-        if font_family in FONT_CHOICES:
-            self.font_family = font_family
-
+        new_theme = THEMES.get(theme_name, self.current_theme)
+        new_font_family = font_family if font_family in FONT_CHOICES else self.font_family
         size_offset = max(FONT_SIZE_OFFSET_RANGE[0], min(FONT_SIZE_OFFSET_RANGE[1], size_offset))
+
+        theme_changed = new_theme is not self.current_theme
+        fonts_changed = new_font_family != self.font_family or size_offset != self.font_size_offset
+
+        self.current_theme = new_theme
+        self.font_family = new_font_family
         self.font_size_offset = size_offset
 
-        self._update_fonts()
-        self._apply_theme()
+        # Both passes touch every styled widget, so skip whichever one has nothing to do.
+        # _apply_theme also sets the per-label fonts, so a font change needs it too.
+        if fonts_changed:
+            self._update_fonts()
+        if fonts_changed or theme_changed:
+            self._apply_theme()
         dialog.destroy()
 
     def _update_fonts(self) -> None:
-        base_size = tkfont.Font().cget("size") + self.font_size_offset
-        for widget in self.root.winfo_children():
-            self._update_widget_font(widget, base_size)
-
-    def _update_widget_font(self, widget: tk.Widget, base_size: int) -> None:
-        if isinstance(widget, tk.Label):
-            current_font = tkfont.Font(font=widget.cget("font"))
-            weight = "bold" if current_font.actual("weight") == "bold" else "normal"
-            slant = "italic" if current_font.actual("slant") == "italic" else "roman"
-            widget.configure(font=(self.font_family, base_size, weight, slant))
-        elif isinstance(widget, tk.Button):
-            widget.configure(font=(self.font_family, base_size))
-        elif isinstance(widget, tk.Text):
-            widget.configure(font=("Consolas", max(8, base_size)))
-
+        base_size = self.new_font_size + self.font_size_offset
+        for label in self._font_labels:
+            weight, slant = self._font_style(str(label.cget("font")))
+            label.configure(font=(self.font_family, base_size, weight, slant))
+        for button in self._font_buttons:
+            button.configure(font=(self.font_family, base_size))
+        for text in self._font_texts:
+            text.configure(font=("Consolas", max(8, base_size)))
+
+    def _collect_font_widgets(self, widget: tk.Misc) -> None:
+        # The main window's widget tree is fixed after construction, so the widgets
+        # whose fonts _update_fonts manages are gathered once instead of walked each time.
         for child in widget.winfo_children():
-            self._update_widget_font(child, base_size)
+            font_widgets = self._font_widget_lists.get(type(child))
+            if font_widgets is not None:
+                # Labels, buttons and text boxes are leaves here; no need to walk into them.
+                font_widgets.append(child)
+                continue
+            self._collect_font_widgets(child)
+
+    def _font_style(self, font_spec: str) -> Tuple[str, str]:
+        # Resolving a font is a Tcl round-trip, so (weight, slant) is cached per font spec.
+        style = self._font_style_cache.get(font_spec)
+        if style is None:
+            actual = tkfont.Font(root=self.root, font=font_spec).actual()
+            style = (
+                "bold" if actual["weight"] == "bold" else "normal",
+                "italic" if actual["slant"] == "italic" else "roman",
+            )
+            self._font_style_cache[font_spec] = style
+        return style
 
     def _log(self, message: str) -> None:
+        # Messages are buffered and written in one batch once the event loop is idle,
+        # so a burst of warnings costs a single update of the log widget.
+        self._log_buffer.append(message)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_flush_pending = False
+        if not self._log_buffer:
+            return
+
         self.status_text.configure(state=tk.NORMAL)
-        self.status_text.insert(tk.END, message + "\n")
+        self.status_text.insert(tk.END, "\n".join(self._log_buffer) + "\n")
         self.status_text.configure(state=tk.DISABLED)
         self.status_text.see(tk.END)
+        self._log_buffer.clear()
 
 
 def launch_gui() -> None: